@@ -10,15 +10,25 @@ Major improvements:
 """
 
 import os
+import csv
 import time
 import re
-import hashlib
-import requests
+import json
+import atexit
+import queue
+import sqlite3
+import itertools
+import xxhash
+import urllib3
+import httpx
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import undetected_chromedriver as uc
 import threading
 from datetime import datetime
+from lxml import html as lxml_html
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.common.exceptions import TimeoutException
@@ -31,21 +41,98 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # ---------- CONFIGURATION ----------
-MAX_IMAGE_WORKERS = 10  # Parallel image downloads
+MAX_IMAGE_WORKERS = 10     # Parallel image downloads
+MAX_PROPERTY_WORKERS = 16  # Parallel HTTP fetches of detail pages
+FALLBACK_DRIVERS = 4       # Extra browsers for the Selenium fallback path
 REDUCED_WAIT_TIME = 5   # Reduced from 15 seconds
-PAGE_LOAD_WAIT = 2      # Reduced from 2-3 seconds
-PROPERTY_LOAD_WAIT = 2  # Reduced from 3 seconds
 
-# Session for connection pooling
-session = requests.Session()
-session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-})
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Column order for the streamed CSV rows (matches the property_data dicts)
+CSV_FIELDS = [
+    "Title", "Price", "Rooms", "Living Space", "Location", "Surroundings",
+    "Available From", "Type", "No_of_rooms", "Number of bathrooms",
+    "Surface Living", "Last Refurbishment", "Year Built", "Features",
+    "Description", "Name", "Full address", "Phone", "Listing ID",
+    "Object Reference", "Latitude", "Longitude", "Type (Rent/Buy)",
+    "URL", "Website", "Images", "IsActive", "Last Seen Date",
+]
+
+# Pooled HTTP client for detail-page fetches - keep-alive connections so the
+# fetch workers reuse warm TLS sockets instead of renegotiating
+http = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=MAX_PROPERTY_WORKERS,
+    block=True,
+    headers={
+        'User-Agent': USER_AGENT,
+        'Connection': 'keep-alive',
+    },
+    retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+
+# HTTP/2 client for the image CDN - one multiplexed TLS connection carries a
+# whole gallery instead of MAX_IMAGE_WORKERS separate HTTP/1.1 handshakes
+IMAGE_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=3,
+        http2=True,
+        limits=httpx.Limits(max_connections=MAX_IMAGE_WORKERS,
+                            max_keepalive_connections=MAX_IMAGE_WORKERS),
+    ),
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    headers={
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'identity',  # images are already compressed, skip gzip CPU
+    },
+)
+atexit.register(IMAGE_CLIENT.close)
+
+# ---------- PERSISTENT CACHE ----------
+# Seen listing URLs and image content hashes live in a small SQLite file so
+# incremental runs skip work done in earlier runs instead of redoing it
+CACHE_DB_PATH = "homegate_cache.db"
+_cache_lock = threading.Lock()
+cache_db = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+cache_db.executescript(
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "CREATE TABLE IF NOT EXISTS seen(url TEXT PRIMARY KEY);"
+    "CREATE TABLE IF NOT EXISTS img_hash(h TEXT PRIMARY KEY);"
+)
+atexit.register(cache_db.close)
+
+def cache_filter_new(urls):
+    """Drop URLs already recorded in earlier runs. Read-only: a URL is
+    only recorded (cache_mark_scraped) once its row has been written, so
+    failed or interrupted scrapes stay retryable on the next run."""
+    with _cache_lock:
+        return [
+            u for u in urls
+            if cache_db.execute("SELECT 1 FROM seen WHERE url=?", (u,)).fetchone() is None
+        ]
+
+def cache_mark_scraped(url):
+    """Record a listing URL whose row made it into the CSV."""
+    with _cache_lock:
+        cache_db.execute("INSERT OR IGNORE INTO seen VALUES(?)", (url,))
+        cache_db.commit()
 
-# Lock to guard shared in-memory structures during parallel writes
-download_hashes_lock = threading.Lock()
+def cache_mark_image(img_hash):
+    """Record an image content hash; False means we already have this image."""
+    with _cache_lock:
+        cur = cache_db.execute("INSERT OR IGNORE INTO img_hash VALUES(?)", (img_hash,))
+        cache_db.commit()
+        return cur.rowcount == 1
+
+# One long-lived worker pool for all image downloads - creating and tearing
+# down 10 threads per listing was pure overhead and dropped warm connections
+IMAGE_POOL = ThreadPoolExecutor(max_workers=MAX_IMAGE_WORKERS, thread_name_prefix='img-dl')
+atexit.register(IMAGE_POOL.shutdown, wait=True)
 
 # ---------- DRIVER SETUP ----------
+_DEBUG_PORTS = itertools.count(8800)
+
 def init_driver():
     options = uc.ChromeOptions()
     options.add_argument('--no-sandbox')
@@ -55,49 +142,88 @@ def init_driver():
     options.add_argument('--disable-plugins')
     options.add_argument('--headless')
     options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    options.add_argument(f'--user-agent={USER_AGENT}')
     # Performance optimizations
     options.add_argument('--disable-dev-tools')
     options.add_argument('--disable-logging')
     options.add_argument('--log-level=3')
-    options.add_argument(f"--remote-debugging-port={8800}")
+    # Each driver needs its own debugging port now that several may coexist
+    options.add_argument(f"--remote-debugging-port={next(_DEBUG_PORTS)}")
     
     # Set Brave binary location for Linux
     # options.binary_location = "/usr/bin/brave-browser"
 
     options.page_load_strategy = 'eager'  # Don't wait for all resources
 
+    # Never render images in the browser - their URLs are read from the DOM
+    # and the files are fetched separately over the HTTP pool
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+
     try:
         driver = uc.Chrome(options=options)
     except:
         from selenium import webdriver
         driver = webdriver.Chrome(options=options)
+
+    # Block heavy/irrelevant resources at the network layer: media, fonts
+    # and trackers only slow down domcontentloaded
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.mp4",
+            "*.woff*", "*.ttf",
+            "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+            "*facebook.net*", "*hotjar*",
+        ]})
+    except Exception as e:
+        logger.debug(f"CDP request blocking unavailable: {e}")
+
     driver.maximize_window()
     wait = WebDriverWait(driver, REDUCED_WAIT_TIME)
     return driver, wait
 
-# ---------- SAFE FIND ----------
-def safe_find(driver, by, value, attr=None, default="not found"):
-    try:
-        el = driver.find_element(by, value)
-        return el.get_attribute(attr) if attr else el.text.strip()
-    except:
-        return default
+# ---------- FALLBACK DRIVER POOL ----------
+# Browsers for the Selenium fallback path, created lazily up to
+# FALLBACK_DRIVERS so a run with few fallbacks doesn't pay Chrome startup
+DRIVER_POOL = queue.Queue()
+_driver_pool_lock = threading.Lock()
+_drivers_created = 0
 
-# ---------- LAT/LONG ----------
-def extract_coordinates_from_iframe(driver, wait):
+def checkout_driver():
+    """Take a (driver, wait) pair from the pool, creating one if under the cap."""
+    global _drivers_created
     try:
-        iframe = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[src*='google.com/maps']")))
-        src_url = iframe.get_attribute("src")
-        if src_url:
-            return parse_coordinates_from_url(src_url)
-    except TimeoutException:
+        return DRIVER_POOL.get_nowait()
+    except queue.Empty:
         pass
-    return None, None
+    with _driver_pool_lock:
+        if _drivers_created < FALLBACK_DRIVERS:
+            _drivers_created += 1
+            return init_driver()
+    return DRIVER_POOL.get()
+
+def shutdown_driver_pool():
+    """Quit every pooled driver (call once at the end of the run)."""
+    while True:
+        try:
+            driver, _ = DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+# ---------- LAT/LONG ----------
+# Compiled once - both patterns sit on per-property / per-page hot paths
+_COORD_RE = re.compile(r"q=(-?\d+\.?\d*),(-?\d+\.?\d*)")
+_EP_RE = re.compile(r"ep=\d+")
 
 def parse_coordinates_from_url(url):
-    pattern = r"q=(-?\d+\.?\d*),(-?\d+\.?\d*)"
-    match = re.search(pattern, url)
+    match = _COORD_RE.search(url)
     if match:
         lat, lng = match.groups()
         return float(lat), float(lng)
@@ -105,126 +231,477 @@ def parse_coordinates_from_url(url):
 
 # Added: Retry, Exceptions. removed hashlib
 # ---------- OPTIMIZED IMAGE DOWNLOAD ----------
-def download_single_image(img_url, folder_path, img_num, downloaded_hashes):
-    """Download a single image - used by ThreadPoolExecutor"""
+def download_single_image(img_url, filename):
+    """Download a single image to a precomputed path - used by the image pool"""
     try:
         if not img_url or img_url.startswith("data:image"):
             return (False, "invalid_url_or_data_uri", img_url)
 
-        last_error = None
-        # Retry a few times in case of transient network hiccups
-        for _ in range(3):
+        # Connect retries are handled by the client's transport config
+        with IMAGE_CLIENT.stream('GET', img_url) as response:
+            if response.status_code != 200:
+                return (False, f"http_status_{response.status_code}", img_url)
+
+            # Stream straight to disk in 64KB chunks, keeping only the
+            # first and last chunk for the dedup fingerprint
+            first_chunk = b""
+            last_chunk = b""
+            # Raw fd writes: the 64KB chunks are already write-sized, so
+            # BufferedWriter would only add an extra userspace copy
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
             try:
-                response = session.get(img_url, timeout=10)
-                if response.status_code == 200 and response.content:
-                    # img_hash = hashlib.md5(response.content).hexdigest()
-                    # # Ensure thread-safe access to the shared set
-                    # with download_hashes_lock:
-                    #     if img_hash in downloaded_hashes:
-                    #         return (False, "duplicate_hash", img_url)
-                    #     downloaded_hashes.add(img_hash)
-
-                    filename = os.path.join(folder_path, f"image_{img_num}.jpg")
-                    with open(filename, "wb") as f:
-                        f.write(response.content)
-                    return (True, filename, img_url)
-                else:
-                    last_error = f"http_status_{response.status_code}"
-            except Exception as e:
-                last_error = e
-                time.sleep(0.2)
-        if last_error:
-            logger.debug(f"Failed to download image {img_num}: {last_error}")
-            return (False, f"failed_after_retries:{last_error}", img_url)
+                for chunk in response.iter_bytes(64 * 1024):
+                    if not first_chunk:
+                        first_chunk = chunk
+                    last_chunk = chunk
+                    os.write(fd, chunk)
+            finally:
+                os.close(fd)
+
+        # Head + tail of a JPEG differ whenever the images differ
+        # (SOI/quantization tables vs final coefficient rows), and
+        # xxh3 is orders of magnitude faster than md5
+        img_hash = xxhash.xxh3_64(first_chunk + last_chunk).hexdigest()
+        if not cache_mark_image(img_hash):
+            os.remove(filename)
+            return (False, "duplicate_hash", img_url)
+        return (True, filename, img_url)
     except Exception as e:
-        logger.debug(f"Failed to download image {img_num}: {e}")
+        logger.debug(f"Failed to download image {filename}: {e}")
         return (False, f"exception:{e}", img_url)
-    return (False, "unknown_error", img_url)
+
+# Image container selectors, tried in order (first match wins)
+IMAGE_SELECTORS = [
+    "ul.splide__list img",
+    ".carousel img",
+    ".gallery img",
+    ".images img",
+    "img[src*='image']"
+]
 
 # Changed: Logging to show Fail Downloads
 # ---------- SCRAPE IMAGES WITH PARALLEL DOWNLOADS ----------
-def scrape_property_images(driver, listing_id, base_image_folder, downloaded_hashes):
-    """Optimized image scraping - no page reload, parallel downloads"""
+def _run_download_job(listing_id, folder_path, img_urls):
+    """Fan one listing's image URLs out to IMAGE_POOL and wait for them."""
+    print(f"📸 Downloading {len(img_urls)} images for {listing_id} in parallel...")
+
+    # Precompute every target path once instead of joining per worker call
+    paths = [os.path.join(folder_path, f"image_{i}.jpg") for i in range(1, len(img_urls) + 1)]
+
+    downloaded_count = 0
+    failures = 0
+    futures = {
+        IMAGE_POOL.submit(download_single_image, url, path): (path, url)
+        for path, url in zip(paths, img_urls)
+    }
+
+    for future in as_completed(futures):
+        try:
+            success, detail, url = future.result()
+            if success:
+                downloaded_count += 1
+            else:
+                failures += 1
+                print(f"❌ Image download skipped/failed: {url} -> {detail}")
+        except Exception as e:
+            failures += 1
+            path, url = futures[future]
+            print(f"❌ Image download exception for {url}: {e}")
+
+    print(f"✅ Downloaded {downloaded_count}/{len(img_urls)} images, failures: {failures}")
+
+def _download_worker():
+    while True:
+        listing_id, folder_path, img_urls = DOWNLOAD_QUEUE.get()
+        try:
+            _run_download_job(listing_id, folder_path, img_urls)
+        except Exception as e:
+            logger.error(f"Image download job failed for {listing_id}: {e}")
+        finally:
+            DOWNLOAD_QUEUE.task_done()
+
+# Image downloads happen off the critical path: the scrape loop only
+# enqueues (listing_id, folder, urls) and moves on, these daemon workers
+# drain the queue. Call DOWNLOAD_QUEUE.join() before saving results.
+DOWNLOAD_QUEUE = queue.Queue(maxsize=200)
+DOWNLOAD_WORKERS = 2
+for _ in range(DOWNLOAD_WORKERS):
+    threading.Thread(target=_download_worker, daemon=True, name='img-job').start()
+
+def download_property_images(listing_id, base_image_folder, img_urls):
+    """Queue a listing's images for background download."""
     folder_path = os.path.join(base_image_folder, listing_id)
-    os.makedirs(folder_path, exist_ok=True)
-    
+    # A stat is cheaper than makedirs walking the whole path each time
+    if not os.path.isdir(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    if not img_urls:
+        return "not found"
+
+    DOWNLOAD_QUEUE.put((listing_id, folder_path, img_urls))
+    return folder_path
+
+# One round trip instead of up to 5 find_elements probes plus a
+# get_attribute call per <img> - the browser resolves, extracts and
+# dedups the URLs itself
+COLLECT_IMAGE_URLS_JS = """
+const sels = arguments[0];
+const out = []; const seen = new Set();
+for (const s of sels) {
+  const els = document.querySelectorAll(s);
+  for (const e of els) {
+    const u = e.currentSrc || e.src || e.getAttribute('data-src') || e.getAttribute('data-lazy-src');
+    if (u && !u.startsWith('data:image') && !seen.has(u)) { seen.add(u); out.push(u); }
+  }
+  if (out.length) break;
+}
+return out;
+"""
+
+def scrape_property_images(driver, listing_id, base_image_folder):
+    """Optimized image scraping - no page reload, parallel downloads"""
     try:
-        # Try multiple selectors for image containers
-        img_elements = []
-        selectors = [
-            "ul.splide__list img",
-            ".carousel img", 
-            ".gallery img",
-            ".images img",
-            "img[src*='image']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    img_elements = elements
-                    break
-            except:
-                continue
-        
-        if not img_elements:
-            return "not found"
-        
-        # Extract all image URLs first
-        img_urls = []
-        for img in img_elements:
-            img_url = img.get_attribute("src") or img.get_attribute("data-src") or img.get_attribute("data-lazy-src")
-            if img_url and not img_url.startswith("data:image"):
-                img_urls.append(img_url)
-
-        # Deduplicate URLs to avoid submitting the same image multiple times
-        img_urls = list(dict.fromkeys(img_urls))
-        
-        if not img_urls:
-            return "not found"
-        
-        print(f"📸 Downloading {len(img_urls)} images for {listing_id} in parallel...")
-        
-        # Use a per-listing hash set to avoid suppressing images across different properties
-        if downloaded_hashes is None:
-            downloaded_hashes = set()
-
-        # Parallel download using ThreadPoolExecutor
-        downloaded_count = 0
-        failures = 0
-        with ThreadPoolExecutor(max_workers=MAX_IMAGE_WORKERS) as executor:
-            futures = {
-                executor.submit(download_single_image, url, folder_path, i, downloaded_hashes): (i, url)
-                for i, url in enumerate(img_urls, start=1)
-            }
+        # Single JS call collects + dedups every image URL
+        img_urls = driver.execute_script(COLLECT_IMAGE_URLS_JS, IMAGE_SELECTORS)
+
+        return download_property_images(listing_id, base_image_folder, img_urls)
 
-            for future in as_completed(futures):
-                try:
-                    success, detail, url = future.result()
-                    if success:
-                        downloaded_count += 1
-                    else:
-                        failures += 1
-                        print(f"❌ Image download skipped/failed: {url} -> {detail}")
-                except Exception as e:
-                    failures += 1
-                    idx, url = futures[future]
-                    print(f"❌ Image download exception for {url}: {e}")
-        
-        print(f"✅ Downloaded {downloaded_count}/{len(img_urls)} images, failures: {failures}")
-        return folder_path if downloaded_count > 0 else "not found"
-        
     except Exception as e:
         logger.error(f"Failed to fetch images for {listing_id}: {e}")
         return "not found"
 
+# Cookie banner, error page and result container probed in one round trip
+# (three separate WebDriver calls before, one of which pulled the whole
+# body text over the wire)
+PAGE_STATE_JS = """
+const b = document.body ? document.body.innerText.toLowerCase() : '';
+return {
+  cookie: !!document.getElementById('onetrust-accept-btn-handler'),
+  err: ['requested page cannot be displayed', 'page cannot be displayed',
+        'no properties found', 'keine objekte gefunden'].some(p => b.includes(p)),
+  container: !!document.querySelector('div[data-test="result-list-container"]')
+};
+"""
+
+# All detail-page fields in one WebDriver round trip (was ~15 find_element
+# hops per property on the fallback path)
+PROPERTY_FIELDS_JS = """
+const txt = (sel) => {
+  const e = document.querySelector(sel);
+  return e ? e.innerText.trim() : 'not found';
+};
+const mainInfo = {};
+const dl = document.querySelector('div.CoreAttributes_coreAttributes_fe6ae dl');
+if (dl) {
+  const kids = [...dl.children];
+  for (let i = 0; i < kids.length - 1; i++) {
+    if (kids[i].tagName === 'DT' && kids[i + 1].tagName === 'DD') {
+      mainInfo[kids[i].innerText.replace(':', '').trim()] = kids[i + 1].innerText.trim();
+    }
+  }
+}
+let objectRef = 'not found';
+for (const dt of document.querySelectorAll('dt')) {
+  if (dt.innerText.includes('Object ref.') && dt.nextElementSibling) {
+    objectRef = dt.nextElementSibling.innerText.trim();
+    break;
+  }
+}
+const tel = document.querySelector("a[href^='tel:']");
+return {
+  title: txt('.ListingTitle_spotlightTitle_75f24'),
+  price: txt('.SpotlightAttributesPrice_value_2af8f'),
+  rooms: txt('.SpotlightAttributesNumberOfRooms_value_a5947'),
+  livingSpace: txt('.SpotlightAttributesUsableSpace_value_48823'),
+  location: txt('.AddressDetails_address_284e6'),
+  name: txt('.ListerContactPhone_person_0c523'),
+  address: txt("[class*='ListingDetails_column'] > address"),
+  phone: tel ? tel.getAttribute('href').replace('tel:', '') : 'not found',
+  description: txt('div.Description_descriptionBody_3745e'),
+  objectRef: objectRef,
+  mainInfo: mainInfo,
+  surroundings: [...document.querySelectorAll('ul.TravelTime_travelTimeList_6208d li')].map(li => li.innerText.trim().split('\\n')),
+  features: document.querySelector('.FeaturesFurnishings_list_871ae')?.innerText.replace(/\\n/g, ', ') || 'not found',
+  mapSrc: document.querySelector("iframe[src*='google.com/maps']")?.src || null
+};
+"""
+
+# ---------- HTTP FAST PATH FOR DETAIL PAGES ----------
+def fetch_property_html(property_url):
+    """Fetch a detail page over the pooled HTTP client and parse it with lxml.
+
+    Homegate detail pages are server-rendered, so most listings never need
+    the browser. Returns None when the response doesn't look like a usable
+    listing page (blocked, redirected, missing title) so the caller can
+    fall back to Selenium.
+    """
+    try:
+        response = http.request('GET', property_url, timeout=urllib3.Timeout(connect=3, read=10))
+        if response.status != 200:
+            return None
+        tree = lxml_html.fromstring(response.data)
+        if not tree.cssselect("[class*='ListingTitle_spotlightTitle']"):
+            return None
+        return tree
+    except Exception as e:
+        logger.debug(f"HTTP fetch failed for {property_url}: {e}")
+        return None
+
+def css_first(tree, selector, attr=None, default="not found"):
+    """lxml counterpart of safe_find - text or attribute of the first match."""
+    try:
+        el = tree.cssselect(selector)[0]
+        if attr:
+            return el.get(attr) or default
+        return el.text_content().strip() or default
+    except Exception:
+        return default
+
+def parse_property(tree, property_url, property_type, base_url):
+    """Build the property dict from a parsed lxml tree (HTTP fast path)."""
+    listing_id = property_url.split("/")[-1]
+
+    phone_number = css_first(tree, "a[href^='tel:']", attr="href").replace("tel:", "")
+
+    object_ref = "not found"
+    ref_els = tree.xpath("//dt[contains(text(), 'Object ref.')]/following-sibling::dd[1]")
+    if ref_els:
+        object_ref = ref_els[0].text_content().strip()
+
+    map_src = css_first(tree, "iframe[src*='google.com/maps']", attr="src", default="")
+    lat, lng = parse_coordinates_from_url(map_src) if map_src else (None, None)
+
+    # Surroundings
+    surroundings_str = "not found"
+    surroundings_dict = {}
+    for item in tree.cssselect("ul.TravelTime_travelTimeList_6208d li"):
+        parts = [t.strip() for t in item.itertext() if t.strip()]
+        if len(parts) == 3:
+            category, time_str, place = parts
+            surroundings_dict[category] = f"{time_str} - {place}"
+    if surroundings_dict:
+        surroundings_str = "; ".join([f"{cat}: {info}" for cat, info in surroundings_dict.items()])
+
+    # Features
+    features = "not found"
+    feature_els = tree.cssselect(".FeaturesFurnishings_list_871ae")
+    if feature_els:
+        features = ", ".join([t.strip() for t in feature_els[0].itertext() if t.strip()])
+
+    # Main info
+    main_info = {}
+    for dl in tree.cssselect("div.CoreAttributes_coreAttributes_fe6ae dl"):
+        for dt, dd in zip(dl.cssselect("dt"), dl.cssselect("dd")):
+            main_info[dt.text_content().strip().replace(":", "")] = dd.text_content().strip()
+        break
+
+    return {
+        "Title": css_first(tree, ".ListingTitle_spotlightTitle_75f24"),
+        "Price": css_first(tree, ".SpotlightAttributesPrice_value_2af8f"),
+        "Rooms": css_first(tree, ".SpotlightAttributesNumberOfRooms_value_a5947"),
+        "Living Space": css_first(tree, ".SpotlightAttributesUsableSpace_value_48823"),
+        "Location": css_first(tree, ".AddressDetails_address_284e6"),
+        "Surroundings": surroundings_str,
+        "Available From": main_info.get("Availability", "not found"),
+        "Type": main_info.get("Type", "not found"),
+        "No_of_rooms": main_info.get("No. of rooms", "not found"),
+        "Number of bathrooms": main_info.get("Number of bathrooms", "not found"),
+        "Surface Living": main_info.get("Living space", "not found"),
+        "Last Refurbishment": main_info.get("Last refurbishment", "not found"),
+        "Year Built": main_info.get("Year of construction", "not found"),
+        "Features": features,
+        "Description": css_first(tree, "div.Description_descriptionBody_3745e"),
+        "Name": css_first(tree, ".ListerContactPhone_person_0c523"),
+        "Full address": css_first(tree, "[class*='ListingDetails_column'] > address"),
+        "Phone": phone_number,
+        "Listing ID": listing_id,
+        "Object Reference": object_ref,
+        "Latitude": lat if lat else "not found",
+        "Longitude": lng if lng else "not found",
+        "Type (Rent/Buy)": property_type,
+        "URL": property_url,
+        "Website": base_url,
+        "Images": listing_id,
+        "IsActive": True,
+        "Last Seen Date": datetime.now()
+    }
+
+def _dig(obj, *path, default=None):
+    """Safe nested-dict lookup: _dig(d, 'a', 'b') == d['a']['b'] or default."""
+    for key in path:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key)
+    return obj if obj is not None else default
+
+def parse_next_data(tree):
+    """Return the listing dict embedded in <script id="__NEXT_DATA__">, if any.
+
+    Most Homegate detail pages ship the full property JSON in the initial
+    HTML, which is both faster and more precise than scraping rendered text.
+    """
+    scripts = tree.xpath("//script[@id='__NEXT_DATA__']/text()")
+    if not scripts:
+        return None
+    try:
+        payload = json.loads(scripts[0])
+    except ValueError:
+        return None
+    listing = _dig(payload, "props", "pageProps", "listing")
+    if isinstance(listing, dict):
+        # Some page variants nest the actual listing one level deeper
+        inner = listing.get("listing")
+        return inner if isinstance(inner, dict) else listing
+    return None
+
+def overlay_next_data(property_data, listing):
+    """Overwrite DOM-scraped fields with typed values from the listing JSON.
+
+    Only fields the JSON actually carries are replaced, so anything it lacks
+    (surroundings, features, lister details) keeps the DOM-scraped value.
+    """
+    lang = _dig(listing, "localization", "primary", default="de")
+    text = _dig(listing, "localization", lang, "text", default={})
+    chars = listing.get("characteristics") or {}
+    address = listing.get("address") or {}
+    geo = address.get("geoCoordinates") or {}
+    prices = listing.get("prices") or {}
+    price = _dig(prices, "buy", "price") or _dig(prices, "rent", "gross")
+
+    overlays = {
+        "Title": text.get("title"),
+        "Description": text.get("description"),
+        "Price": price,
+        "Rooms": chars.get("numberOfRooms"),
+        "No_of_rooms": chars.get("numberOfRooms"),
+        "Living Space": chars.get("livingSpace"),
+        "Surface Living": chars.get("livingSpace"),
+        "Number of bathrooms": chars.get("numberOfBathrooms"),
+        "Year Built": chars.get("yearBuilt"),
+        "Last Refurbishment": chars.get("yearLastRenovated"),
+        "Latitude": geo.get("latitude"),
+        "Longitude": geo.get("longitude"),
+    }
+    for field, value in overlays.items():
+        if value not in (None, ""):
+            property_data[field] = value
+    return property_data
+
+def collect_image_urls_from_tree(tree):
+    """Image-URL extraction for the HTTP fast path (same selectors as Selenium)."""
+    img_urls = []
+    for selector in IMAGE_SELECTORS:
+        elements = tree.cssselect(selector)
+        if elements:
+            for img in elements:
+                img_url = img.get("src") or img.get("data-src") or img.get("data-lazy-src")
+                if img_url and not img_url.startswith("data:image"):
+                    img_urls.append(img_url)
+            break
+    return list(dict.fromkeys(img_urls))
+
+def scrape_property_page(property_url, property_type, base_url, base_image_folder):
+    """Scrape one property entirely over HTTP. Returns None if the page
+    needs the Selenium fallback."""
+    tree = fetch_property_html(property_url)
+    if tree is None:
+        return None
+
+    listing_id = property_url.split("/")[-1]
+    property_data = parse_property(tree, property_url, property_type, base_url)
+
+    # Prefer the typed values from the embedded JSON where available
+    listing_json = parse_next_data(tree)
+    if listing_json:
+        overlay_next_data(property_data, listing_json)
+
+    download_property_images(listing_id, base_image_folder, collect_image_urls_from_tree(tree))
+    return property_data
+
+def scrape_property_fallback(property_url, property_type, base_url, base_image_folder):
+    """Scrape one property with a pooled Selenium driver (HTTP path failed)."""
+    driver, wait = checkout_driver()
+    try:
+        driver.get(property_url)
+        try:
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "ListingTitle_spotlightTitle_75f24")))
+        except TimeoutException:
+            pass
+
+        listing_id = property_url.split("/")[-1]
+
+        # One execute_script round trip returns every field at once
+        fields = driver.execute_script(PROPERTY_FIELDS_JS)
+        main_info = fields.get("mainInfo") or {}
+
+        lat, lng = (None, None)
+        if fields.get("mapSrc"):
+            lat, lng = parse_coordinates_from_url(fields["mapSrc"])
+
+        # Surroundings
+        surroundings_dict = {}
+        for parts in fields.get("surroundings") or []:
+            if len(parts) == 3:
+                category, time_str, place = parts
+                surroundings_dict[category] = f"{time_str} - {place}"
+        surroundings_str = "; ".join([f"{cat}: {info}" for cat, info in surroundings_dict.items()]) or "not found"
+
+        # Scrape images (optimized - no page reload, parallel downloads)
+        scrape_property_images(driver, listing_id, base_image_folder)
+
+        property_data = {
+            "Title": fields["title"],
+            "Price": fields["price"],
+            "Rooms": fields["rooms"],
+            "Living Space": fields["livingSpace"],
+            "Location": fields["location"],
+            "Surroundings": surroundings_str,
+            "Available From": main_info.get("Availability", "not found"),
+            "Type": main_info.get("Type", "not found"),
+            "No_of_rooms": main_info.get("No. of rooms", "not found"),
+            "Number of bathrooms": main_info.get("Number of bathrooms", "not found"),
+            "Surface Living": main_info.get("Living space", "not found"),
+            "Last Refurbishment": main_info.get("Last refurbishment", "not found"),
+            "Year Built": main_info.get("Year of construction", "not found"),
+            "Features": fields["features"],
+            "Description": fields["description"],
+            "Name": fields["name"],
+            "Full address": fields["address"],
+            "Phone": fields["phone"],
+            "Listing ID": listing_id,
+            "Object Reference": fields["objectRef"],
+            "Latitude": lat if lat else "not found",
+            "Longitude": lng if lng else "not found",
+            "Type (Rent/Buy)": property_type,
+            "URL": property_url,
+            "Website": base_url,
+            "Images": listing_id,
+            "IsActive": True,
+            "Last Seen Date": datetime.now()
+        }
+
+        # Prefer the typed values from the embedded JSON where available
+        raw_next = driver.execute_script(
+            "const s = document.getElementById('__NEXT_DATA__'); return s ? s.textContent : null;")
+        if raw_next:
+            try:
+                listing_json = _dig(json.loads(raw_next), "props", "pageProps", "listing")
+                if isinstance(listing_json, dict):
+                    inner = listing_json.get("listing")
+                    overlay_next_data(property_data, inner if isinstance(inner, dict) else listing_json)
+            except ValueError:
+                pass
+
+        return property_data
+    finally:
+        DRIVER_POOL.put((driver, wait))
+
 # ---------- SCRAPE DATA ----------
-def scrape_homegate(driver, wait, base_url, base_image_folder, existing_df=None):
-    all_properties = []
+def scrape_homegate(driver, wait, base_url, base_image_folder, writer, writer_lock, existing_df=None):
+    new_count = 0
+    written_ids = set()
     page_no = 2
     property_type = "Rent" if "/rent/" in base_url else "Buy"
-    downloaded_hashes = set()
     MAX_RETRIES = 3
     RETRY_DELAY = 3
     attempt = 0
@@ -232,62 +709,63 @@ def scrape_homegate(driver, wait, base_url, base_image_folder, existing_df=None)
 
     # Changed Condition: Stop at page 50
     while page_no<=4:
-        page_url = re.sub(r"ep=\d+", f"ep={page_no}", base_url)
+        page_url = _EP_RE.sub(f"ep={page_no}", base_url)
         # Added: Exception
         try:
             driver.get(page_url)
-            time.sleep(PAGE_LOAD_WAIT)
+            # Wait for the element the next step actually needs instead of a
+            # fixed sleep - fast pages stop waiting as soon as it appears
+            try:
+                wait.until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-test="result-list-container"]')),
+                    EC.presence_of_element_located((By.ID, "onetrust-accept-btn-handler")),
+                ))
+            except TimeoutException:
+                pass
         except Exception as e:
             logger.error(f"Couldn't Load Page Url: {page_url} with error {e}")
 
-        # Changed: Accept cookies If Present
+        # Changed: cookie banner / error page / container checked in one JS probe
         try:
-            driver.find_element(By.ID, "onetrust-accept-btn-handler").click()
-            time.sleep(0.5)
-        except:
-            pass
+            state = driver.execute_script(PAGE_STATE_JS)
+        except Exception:
+            state = {"cookie": False, "err": False, "container": False}
 
-        # Quick error page check
-        try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-            if any(phrase in page_text for phrase in [
-                "requested page cannot be displayed",
-                "page cannot be displayed",
-                "no properties found",
-                "keine objekte gefunden"
-            ]):
-                print(f"No properties found at page {page_no, page_url}")
-                break
-        except:
-            pass
+        if state["cookie"]:
+            try:
+                driver.find_element(By.ID, "onetrust-accept-btn-handler").click()
+            except:
+                pass
 
-        # Changed Selector to Get property cards, Exception
+        if state["err"]:
+            print(f"No properties found at page {page_no, page_url}")
+            break
+
+        if not state["container"]:
+            logger.debug(f"Result container missing on page {page_no}")
+
+        # Changed: one JS call returns every card href. The old path cost two
+        # WebDriver round trips per card (is_displayed + get_attribute);
+        # invisible cards still carry valid hrefs and dedup handles repeats.
         try:
-            listings_box = driver.find_element(By.CSS_SELECTOR, 'div[data-test="result-list-container"]')
-            # Correct CSS attribute selector and scope to the listings box
-            cards = listings_box.find_elements(
-                By.CSS_SELECTOR,
-                "[role='listitem'] a[href*='/rent/'], [role='listitem'] a[href*='/buy/']"
+            card_links = driver.execute_script(
+                "return Array.from(document.querySelectorAll("
+                "'div[data-test=\"result-list-container\"] [role=\"listitem\"] a[href*=\"/rent/\"], "
+                "div[data-test=\"result-list-container\"] [role=\"listitem\"] a[href*=\"/buy/\"]'"
+                ")).map(a => a.href).filter(Boolean);"
             )
-            print(f"Found {len(cards)} properties on this page")
+            card_links = list(dict.fromkeys(card_links))
+            print(f"Found {len(card_links)} properties on this page")
         except Exception as e:
             print("⚠️ Could not load property cards", e)
             # Retry delay before next attempt
             attempt += 1
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_DELAY)
+                continue
             else:
                 logging.error(f"🚫 Failed after {MAX_RETRIES} attempts for {page_url}")
                 break
-        # Changed: Selector to get property links, removed unused code
-        try:
-            # Get property cards (try scoped selectors, then broad fallbacks)
-
-            card_links = [c.get_attribute("href") for c in cards if c.is_displayed() and c.get_attribute("href")]
-            card_links = list(dict.fromkeys(card_links))
-            
-        except Exception as e:
-            logging.error(f"⚠️ Could not load property cards: {e}")
 
         if not card_links:
             print(f"✅ Reached last page (no properties found) at page {page_no}")
@@ -306,6 +784,9 @@ def scrape_homegate(driver, wait, base_url, base_image_folder, existing_df=None)
         else:
             filtered_links = card_links
 
+        # Drop anything already visited in an earlier run (on-disk cache)
+        filtered_links = cache_filter_new(filtered_links)
+
         if not filtered_links:
             logger.info("All listings on this page are already scraped. Skipping page.")
             page_no += 1
@@ -314,97 +795,48 @@ def scrape_homegate(driver, wait, base_url, base_image_folder, existing_df=None)
         print(f"\n📄 Page {page_no}: Found {len(filtered_links)} new properties ({property_type})")
         total_links = len(filtered_links)
 
-        for idx, property_url in enumerate(filtered_links, start=1):
-            try:
-                driver.get(property_url)
-                time.sleep(PROPERTY_LOAD_WAIT)
-
-                listing_id = property_url.split("/")[-1]
-                
-                title = safe_find(driver, By.CLASS_NAME, "ListingTitle_spotlightTitle_75f24")
-                price = safe_find(driver, By.CLASS_NAME, 'SpotlightAttributesPrice_value_2af8f')
-                rooms = safe_find(driver, By.CLASS_NAME, "SpotlightAttributesNumberOfRooms_value_a5947")
-                living_space = safe_find(driver, By.CLASS_NAME, "SpotlightAttributesUsableSpace_value_48823")
-                location = safe_find(driver, By.CLASS_NAME, 'AddressDetails_address_284e6')
-                name = safe_find(driver, By.CLASS_NAME, 'ListerContactPhone_person_0c523')
-                address = safe_find(driver, By.XPATH, "//div[contains(@class, 'ListingDetails_column')]/address")
-                phone_number = safe_find(driver, By.CSS_SELECTOR, "a[href^='tel:']", attr="href").replace("tel:", "")
-                description = safe_find(driver, By.CSS_SELECTOR, "div.Description_descriptionBody_3745e")
-                object_ref = safe_find(driver, By.XPATH, "//dt[contains(text(), 'Object ref.')]/following-sibling::dd[1]")
-                lat, lng = extract_coordinates_from_iframe(driver, wait)
-
-                # Surroundings
-                surroundings_str = "not found"
-                try:
-                    surrounding_list_element = driver.find_element(By.CSS_SELECTOR, "ul.TravelTime_travelTimeList_6208d")
-                    items = surrounding_list_element.find_elements(By.TAG_NAME, "li")
-                    surroundings_dict = {}
-                    for item in items:
-                        parts = item.text.strip().split("\n")
-                        if len(parts) == 3:
-                            category, time_str, place = parts
-                            surroundings_dict[category] = f"{time_str} - {place}"
-                    surroundings_str = "; ".join([f"{cat}: {info}" for cat, info in surroundings_dict.items()])
-                except:
-                    pass
-
-                # Features
-                try:
-                    features_element = driver.find_element(By.CLASS_NAME, "FeaturesFurnishings_list_871ae")
-                    features = features_element.text.replace("\n", ", ")
-                except:
-                    features = "not found"
-
-                # Main info
-                main_info = {}
+        # Fast path: detail pages are server-rendered, so fetch them over the
+        # pooled HTTP client in parallel. Listings whose HTML doesn't come
+        # back usable drop through to the Selenium loop below.
+        fallback_links = []
+        scraped_count = 0
+        with ThreadPoolExecutor(max_workers=MAX_PROPERTY_WORKERS) as executor:
+            futures = {
+                executor.submit(scrape_property_page, url, property_type, base_url,
+                                base_image_folder): url
+                for url in filtered_links
+            }
+            for future in as_completed(futures):
+                url = futures[future]
                 try:
-                    main_info_div = driver.find_element(By.CSS_SELECTOR, "div.CoreAttributes_coreAttributes_fe6ae dl")
-                    dt_elements = main_info_div.find_elements(By.TAG_NAME, "dt")
-                    dd_elements = main_info_div.find_elements(By.TAG_NAME, "dd")
-                    for dt, dd in zip(dt_elements, dd_elements):
-                        main_info[dt.text.strip().replace(":", "")] = dd.text.strip()
-                except:
-                    pass
-
-                # Scrape images (optimized - no page reload, parallel downloads)
-                scrape_property_images(driver, listing_id, base_image_folder, downloaded_hashes)
-
-                property_data = {
-                    "Title": title,
-                    "Price": price,
-                    "Rooms": rooms,
-                    "Living Space": living_space,
-                    "Location": location,
-                    "Surroundings": surroundings_str,
-                    "Available From": main_info.get("Availability", "not found"),
-                    "Type": main_info.get("Type", "not found"),
-                    "No_of_rooms": main_info.get("No. of rooms", "not found"),
-                    "Number of bathrooms": main_info.get("Number of bathrooms", "not found"),
-                    "Surface Living": main_info.get("Living space", "not found"),
-                    "Last Refurbishment": main_info.get("Last refurbishment", "not found"),
-                    "Year Built": main_info.get("Year of construction", "not found"),
-                    "Features": features,
-                    "Description": description,
-                    "Name": name,
-                    "Full address": address,
-                    "Phone": phone_number,
-                    "Listing ID": listing_id,
-                    "Object Reference": object_ref,
-                    "Latitude": lat if lat else "not found",
-                    "Longitude": lng if lng else "not found",
-                    "Type (Rent/Buy)": property_type,
-                    "URL": property_url,
-                    "Website": base_url,
-                    "Images": listing_id,
-                    "IsActive": True,
-                    "Last Seen Date": datetime.now()
+                    property_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error scraping property {url}: {e}")
+                    continue
+                if property_data is None:
+                    fallback_links.append(url)
+                else:
+                    new_count += write_property_row(property_data, writer, writer_lock, written_ids)
+                    scraped_count += 1
+                    print(f"✅ [{scraped_count}/{total_links}] {property_data['Title'][:40]}...")
+
+        if fallback_links:
+            logger.info(f"{len(fallback_links)} listings need the Selenium fallback")
+            with ThreadPoolExecutor(max_workers=FALLBACK_DRIVERS) as executor:
+                fb_futures = {
+                    executor.submit(scrape_property_fallback, url, property_type, base_url,
+                                    base_image_folder): url
+                    for url in fallback_links
                 }
-
-                all_properties.append(property_data)
-                print(f"✅ [{idx}/{total_links}] {title[:40]}...")
-
-            except Exception as e:
-                logger.error(f"Error scraping property {idx}: {e}")
+                for idx, future in enumerate(as_completed(fb_futures), start=1):
+                    url = fb_futures[future]
+                    try:
+                        property_data = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scraping property {url}: {e}")
+                        continue
+                    new_count += write_property_row(property_data, writer, writer_lock, written_ids)
+                    print(f"✅ [{idx}/{len(fallback_links)}] {property_data['Title'][:40]} (fallback)...")
 
         page_no += 1
     
@@ -424,34 +856,47 @@ def scrape_homegate(driver, wait, base_url, base_image_folder, existing_df=None)
         # Mark unseen listings as inactive
         existing_df.loc[~mask_seen, "IsActive"] = False
 
-    return all_properties
+    return new_count
 
 # ---------- SAVE DATA ----------
-def save_data(data, save_dir, property_type, existing_df=None):
-    os.makedirs(save_dir, exist_ok=True)
-    file_name = os.path.join(save_dir, f"homegate_{property_type}.csv")
-
-    data_df = pd.DataFrame(data)
-    data_df = data_df.drop_duplicates(subset=["Listing ID"])
-    
-    if os.path.exists(file_name) and existing_df is not None and not existing_df.empty:
-        # Save the updated existing_df + new data
-        combined_df = pd.concat([existing_df, data_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=["Listing ID"], keep='last')
-        combined_df.to_csv(file_name, index=False)
-        logging.info("Updated existing data")
-
-    elif os.path.exists(file_name):
-        # File exists but no existing_df provided - just append new data
-        data_df.to_csv(file_name, index=False, mode='a', header=False)
-        logging.info("Appending new data to existing file")
-
-    else:
-        # File doesn't exist - create new file
-        data_df.to_csv(file_name, index=False)
-        logging.info("Created new data file")
-    
-    logging.info(f"\n💾 {property_type} data saved to {file_name}\n\n")
+def write_property_row(property_data, writer, writer_lock, written_ids):
+    """Stream one scraped property to the open CSV. Returns rows written."""
+    listing_id = str(property_data["Listing ID"])
+    with writer_lock:
+        if listing_id in written_ids:
+            return 0
+        written_ids.add(listing_id)
+        writer.writerow(property_data)
+    # Only now is the listing safe to skip on future runs
+    cache_mark_scraped(property_data["URL"])
+    return 1
+
+def write_csv_fast(df, file_name):
+    """Emit a DataFrame through pyarrow's vectorized C++ CSV writer
+    (pandas' pure-Python to_csv is measurably slower at 10k+ rows).
+    Nulls are blanked before the string cast - astype(str) alone would
+    turn every NaN into the literal string 'nan' in the file."""
+    pacsv.write_csv(pa.Table.from_pandas(df.fillna("").astype(str), preserve_index=False), file_name)
+
+def finalize_csv(file_name, existing_df):
+    """Fold the updated IsActive/Last Seen flags back into the file.
+
+    New rows were already streamed in as they were scraped (crash-safe
+    partial output); this single rewrite only refreshes the bookkeeping
+    columns of the pre-existing rows and drops stale duplicates.
+    """
+    if existing_df is None or existing_df.empty:
+        return
+    full_df = pd.read_csv(file_name)
+    full_df["Listing ID"] = full_df["Listing ID"].astype(str)
+    existing_df["Listing ID"] = existing_df["Listing ID"].astype(str)
+    flags = existing_df.set_index("Listing ID")[["IsActive", "Last Seen Date"]]
+    mask = full_df["Listing ID"].isin(flags.index)
+    full_df.loc[mask, "IsActive"] = full_df.loc[mask, "Listing ID"].map(flags["IsActive"]).values
+    full_df.loc[mask, "Last Seen Date"] = full_df.loc[mask, "Listing ID"].map(flags["Last Seen Date"]).values
+    full_df = full_df.drop_duplicates(subset=["Listing ID"], keep="last")
+    write_csv_fast(full_df, file_name)
+    logging.info(f"\n💾 Data saved to {file_name}\n\n")
 
 # ---------- MAIN ----------
 def main():
@@ -459,8 +904,7 @@ def main():
     print("🚀 Starting Homegate Scraper (OPTIMIZED VERSION)")
     print("="*60)
     print(f"⚡ Parallel image downloads: {MAX_IMAGE_WORKERS} workers")
-    print(f"⚡ Reduced wait times: {REDUCED_WAIT_TIME}s")
-    print(f"⚡ Page load wait: {PAGE_LOAD_WAIT}s")
+    print(f"⚡ Explicit waits, up to {REDUCED_WAIT_TIME}s")
     print("="*60)
     
     driver, wait = init_driver()
@@ -500,13 +944,27 @@ def main():
                 existing_df = None
                 logging.info(f"No existing Data for {property_type}. Performing Full scrape.")
 
-            data = scrape_homegate(driver, wait, url, base_image_folder, existing_df)
+            # Stream rows to disk as they're scraped: crash-safe partial
+            # output, O(1) memory instead of holding the whole run in RAM
+            is_new_file = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+            csvfile = open(csv_path, "a", newline="", buffering=1 << 20)
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+            if is_new_file:
+                writer.writeheader()
+            writer_lock = threading.Lock()
+
+            try:
+                new_count = scrape_homegate(driver, wait, url, base_image_folder,
+                                            writer, writer_lock, existing_df)
+            finally:
+                csvfile.close()
             logging.info("Script Completed")
-            save_data(data, save_dir, property_type, existing_df)
-            
-            total_properties += len(data)
+            DOWNLOAD_QUEUE.join()  # flush background image downloads
+            finalize_csv(csv_path, existing_df)
+
+            total_properties += new_count
             url_time = time.time() - url_start_time
-            print(f"✅ {property_type} completed: {len(data)} properties in {url_time:.2f}s ({url_time/60:.2f}min)")
+            print(f"✅ {property_type} completed: {new_count} properties in {url_time:.2f}s ({url_time/60:.2f}min)")
         
         end_time = time.time()
         total_time = end_time - start_time
@@ -524,7 +982,10 @@ def main():
     finally:
         print("🔚 Closing browser...")
         driver.quit()
-        session.close()
+        shutdown_driver_pool()
+        IMAGE_POOL.shutdown(wait=True)
+        IMAGE_CLIENT.close()
+        http.clear()
         print("✅ Cleanup complete")
 
 if __name__ == "__main__":
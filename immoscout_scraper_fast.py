@@ -12,7 +12,13 @@ Major improvements:
 import os
 import time
 import re
-import hashlib
+import atexit
+import shutil
+import sqlite3
+import itertools
+import asyncio
+import aiohttp
+import xxhash
 import requests
 import logging
 import pandas as pd
@@ -20,6 +26,9 @@ from datetime import datetime
 import undetected_chromedriver as uc
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -30,25 +39,112 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # ---------- CONFIGURATION ----------
-MAX_IMAGE_WORKERS = 10  # Parallel image downloads
+MAX_IMAGE_WORKERS = 24  # Parallel image downloads (shared across listings)
+MAX_LISTING_WORKERS = 16  # Parallel detail-page HTTP fetches
 REDUCED_WAIT_TIME = 5   # Reduced from 15 seconds
-PAGE_LOAD_WAIT = 2      # Reduced from 2-3 seconds
-PROPERTY_LOAD_WAIT = 2  # Reduced from 3 seconds
 
-# Session for connection pooling
+# Session for connection pooling - adapters sized for the parallel detail
+# fetches, with transient-error retries handled by urllib3
 session = requests.Session()
 session.headers.update({
     'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 })
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    # sized for the parallel detail-page fetches; image downloads run on
+    # their own aiohttp session
+    pool_maxsize=MAX_LISTING_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
+
+def sync_driver_cookies(driver):
+    """Copy the browser's cookies into the shared session so plain HTTP
+    fetches ride on the anti-bot clearance the driver already earned."""
+    try:
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+    except Exception as e:
+        logger.debug(f"Could not sync driver cookies: {e}")
 
 # Lock to guard shared in-memory structures during parallel writes
 download_hashes_lock = threading.Lock()
 
+# ---------- PERSISTENT SEEN-STATE ----------
+# Small SQLite database remembering which listings and image URLs previous
+# runs handled, so restarts don't depend on re-reading the data file and
+# image dedup survives across runs. WAL lets concurrent threads read while
+# one writes; the lock serializes access to the shared connection.
+SEEN_DB_PATH = "seen.db"
+_seen_db_lock = threading.Lock()
+seen_db = sqlite3.connect(SEEN_DB_PATH, check_same_thread=False)
+seen_db.execute("PRAGMA journal_mode=WAL")
+seen_db.execute("CREATE TABLE IF NOT EXISTS listings (id INTEGER PRIMARY KEY, type TEXT, last_seen TEXT, is_active INTEGER DEFAULT 1)")
+seen_db.execute("CREATE TABLE IF NOT EXISTS image_urls (url TEXT PRIMARY KEY)")
+seen_db.commit()
+
+def db_load_listing_ids():
+    """IDs of every listing a previous run has recorded."""
+    with _seen_db_lock:
+        return {row[0] for row in seen_db.execute("SELECT id FROM listings")}
+
+def db_record_run(property_type, active_ids):
+    """Persist one run's outcome in two batched statements.
+
+    Rows carry the property type so the concurrent Rent and Buy runs only
+    flip their own listings: everything of this type is reset to inactive,
+    then the IDs this run saw are upserted back as active.
+    """
+    now = datetime.now().isoformat()
+    with _seen_db_lock:
+        seen_db.execute("UPDATE listings SET is_active = 0 WHERE type = ?", (property_type,))
+        seen_db.executemany(
+            "INSERT INTO listings (id, type, last_seen, is_active) VALUES (?, ?, ?, 1) "
+            "ON CONFLICT(id) DO UPDATE SET type = excluded.type, last_seen = excluded.last_seen, is_active = 1",
+            [(int(i), property_type, now) for i in active_ids],
+        )
+        seen_db.commit()
+
+def db_record_urls(urls):
+    if not urls:
+        return
+    with _seen_db_lock:
+        seen_db.executemany("INSERT OR IGNORE INTO image_urls (url) VALUES (?)", [(u,) for u in urls])
+        seen_db.commit()
+
+# URLs already fetched - listings frequently repeat the same CDN asset
+# (agency logos, shared gallery shots), and skipping by URL avoids even
+# starting the request that hash dedup would only catch afterwards.
+# Seeded from the database so the skip persists across runs; new URLs are
+# batched into _NEW_URLS and flushed per listing.
+_SEEN_URL_LOCK = threading.Lock()
+_SEEN_URLS = {row[0] for row in seen_db.execute("SELECT url FROM image_urls")}
+_NEW_URLS = []
+
 # ---------- DRIVER SETUP ----------
+# Each driver needs its own debug port and profile dir so two browsers can
+# run side by side (one per listing URL)
+_DEBUG_PORTS = itertools.count(8500)
+
+# undetected_chromedriver patches the shared chromedriver binary on start;
+# two instances launching at once race on that file, so creation is
+# serialized (the drivers still run concurrently afterwards)
+_driver_init_lock = threading.Lock()
+
 def init_driver():
+    port = next(_DEBUG_PORTS)
     options = uc.ChromeOptions()
     options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
+    # Keep the profile in shared memory instead of pushing Chrome's temp
+    # storage to disk with --disable-dev-shm-usage; profile and cache I/O
+    # then run at RAM speed. The dir is removed at exit - tmpfs space is
+    # RAM, and leaked profiles would accumulate until /dev/shm fills
+    profile_dir = f'/dev/shm/chrome-profile-{os.getpid()}-{port}'
+    atexit.register(shutil.rmtree, profile_dir, ignore_errors=True)
+    options.add_argument(f'--user-data-dir={profile_dir}')
+    options.add_argument('--disk-cache-size=104857600')  # 100 MB
+    options.add_argument('--disable-features=Translate,BackForwardCache')
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
@@ -59,158 +155,409 @@ def init_driver():
     options.add_argument('--disable-dev-tools')
     options.add_argument('--disable-logging')
     options.add_argument('--log-level=3')
-    options.add_argument(f"--remote-debugging-port={8500}")
+    options.add_argument(f"--remote-debugging-port={port}")
     options.page_load_strategy = 'eager'  # Don't wait for all resources
     
-    try:
-        driver = uc.Chrome(options=options)
-    except:
-        from selenium import webdriver
-        driver = webdriver.Chrome(options=options)
-    
+    with _driver_init_lock:
+        try:
+            driver = uc.Chrome(options=options)
+        except:
+            from selenium import webdriver
+            driver = webdriver.Chrome(options=options)
+
     driver.maximize_window()
+
+    # Block heavyweight resources at the network layer - the scraper only
+    # needs the DOM, and images are downloaded separately over HTTP. CDP is
+    # best-effort: a plain-webdriver fallback may not expose it.
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*.css",
+            "*.woff", "*.woff2", "*.ttf", "*.otf",
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+            "*googletagmanager.com*",
+            "*google-analytics.com*",
+            "*doubleclick.net*",
+            "*facebook.net*",
+            "*hotjar.com*",
+        ]})
+    except Exception as e:
+        logger.debug(f"CDP resource blocking unavailable: {e}")
+
     # Reduced wait time
     wait = WebDriverWait(driver, REDUCED_WAIT_TIME)
     return driver, wait
 
-# ---------- SAFE FIND ----------
-def safe_find(driver, by, value, attr=None, default="not found"):
-    try:
-        el = driver.find_element(by, value)
-        return el.get_attribute(attr) if attr else el.text.strip()
-    except:
-        return default
+# Compiled once at import; these run for every property / page URL
+_COORD_RE = re.compile(r"q=(-?\d+\.?\d*),(-?\d+\.?\d*)")
+_PN_RE = re.compile(r"pn=\d+")
 
 # ---------- LAT/LONG ----------
-def extract_coordinates_from_iframe(driver, wait):
-    try:
-        iframe = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[src*='google.com/maps']")))
-        src_url = iframe.get_attribute("src")
-        if src_url:
-            return parse_coordinates_from_url(src_url)
-    except TimeoutException:
-        pass
-    return None, None
-
 def parse_coordinates_from_url(url):
-    pattern = r"q=(-?\d+\.?\d*),(-?\d+\.?\d*)"
-    match = re.search(pattern, url)
+    match = _COORD_RE.search(url)
     if match:
         lat, lng = match.groups()
         return float(lat), float(lng)
     return None, None
 
+# Simple innerText fields and the selector each one comes from; shared by
+# the batch JS below and the selectolax fast path so the two extraction
+# paths can't drift apart when the site's hashed class names change
+FIELD_SELECTORS = {
+    "title": ".ListingTitle_spotlightTitle_75f24",
+    "rent": ".SpotlightAttributesPrice_value_2af8f",
+    "rooms": ".SpotlightAttributesNumberOfRooms_value_a5947",
+    "livingSpace": ".SpotlightAttributesUsableSpace_value_48823",
+    "location": ".AddressDetails_address_284e6",
+    "name": ".ListerContactPhone_person_0c523",
+    "address": "[class*='ListingDetails_column'] > address",
+    "description": "div.Description_descriptionBody_3745e",
+}
+
+# Every detail-page field in a single execute_script round trip - each
+# separate find_element/.text call costs a full JSON-wire IPC hop, and the
+# old path made ~20 of them per property. Selectors come in as arguments:
+# FIELD_SELECTORS as arguments[0], IMAGE_SELECTORS as arguments[1].
+IMMO_PROPERTY_JS = """
+const fieldSels = arguments[0];
+const imgSels = arguments[1];
+const txt = (sel) => {
+  const e = document.querySelector(sel);
+  return e ? e.innerText.trim() : 'not found';
+};
+const fields = {};
+for (const [key, sel] of Object.entries(fieldSels)) fields[key] = txt(sel);
+const mainInfo = {};
+document.querySelectorAll('div.CoreAttributes_coreAttributes_fe6ae dl dt').forEach((dt) => {
+  const dd = dt.nextElementSibling;
+  if (dd) mainInfo[dt.innerText.replace(':', '').trim()] = dd.innerText.trim();
+});
+let objectRef = 'not found';
+for (const dt of document.querySelectorAll('dt')) {
+  if (dt.innerText.includes('Object ref.') && dt.nextElementSibling) {
+    objectRef = dt.nextElementSibling.innerText.trim();
+    break;
+  }
+}
+const imgUrls = []; const seen = new Set();
+for (const s of imgSels) {
+  for (const e of document.querySelectorAll(s)) {
+    const u = e.currentSrc || e.src || e.getAttribute('data-src') || e.getAttribute('data-lazy-src');
+    if (u && !u.startsWith('data:image') && !seen.has(u)) { seen.add(u); imgUrls.push(u); }
+  }
+  if (imgUrls.length) break;
+}
+const tel = document.querySelector("a[href^='tel:']");
+return {
+  ...fields,
+  phone: tel ? tel.getAttribute('href').replace('tel:', '') : 'not found',
+  objectRef: objectRef,
+  mainInfo: mainInfo,
+  surroundings: [...document.querySelectorAll('ul.TravelTime_travelTimeList_6208d li')].map(li => li.innerText.trim().split('\\n')),
+  features: document.querySelector('.FeaturesFurnishings_list_871ae')?.innerText.replace(/\\n/g, ', ') || 'not found',
+  mapSrc: document.querySelector("iframe[src*='google.com/maps']")?.src || null,
+  imgUrls: imgUrls
+};
+"""
+
+# ---------- HTTP FAST PATH FOR DETAIL PAGES ----------
+# Image container selectors, tried in order (first match wins); also passed
+# into IMMO_PROPERTY_JS so both paths share one list
+IMAGE_SELECTORS = [
+    "ul.splide__list img",
+    "li[class*='splide__slide'] img",
+    ".carousel img",
+    ".gallery img",
+    ".images img",
+    "img[src*='image']",
+    ".splide__list img",
+]
+
+def fetch_property_tree(property_url):
+    """Fetch a detail page over the shared session and parse with selectolax.
+
+    The listing pages are static HTML, so a keep-alive GET replaces a full
+    browser navigation for most properties. Returns None when the response
+    doesn't look like a usable listing page (blocked, redirected, missing
+    title) so the caller can fall back to the Selenium path.
+    """
+    try:
+        response = session.get(property_url, timeout=10)
+        if response.status_code != 200:
+            return None
+        tree = HTMLParser(response.text)
+        if tree.css_first("[class*='ListingTitle_spotlightTitle']") is None:
+            return None
+        return tree
+    except Exception as e:
+        logger.debug(f"HTTP fetch failed for {property_url}: {e}")
+        return None
+
+def css_text(tree, selector, default="not found"):
+    """First match's text for a selector, selectolax flavour of safe_find."""
+    node = tree.css_first(selector)
+    if node is None:
+        return default
+    return node.text(strip=True) or default
+
+def _node_lines(node):
+    return [s.strip() for s in node.text(separator="\n").split("\n") if s.strip()]
+
+def format_surroundings(rows):
+    """Format [category, time, place] rows into the stored summary string."""
+    surroundings_dict = {}
+    for parts in rows or []:
+        if len(parts) == 3:
+            category, time_str, place = parts
+            surroundings_dict[category] = f"{time_str} - {place}"
+    return "; ".join([f"{cat}: {info}" for cat, info in surroundings_dict.items()]) or "not found"
+
+def build_property_row(fields, property_url, property_type, base_url):
+    """Assemble the output row from normalized extraction results.
+
+    `fields` uses the key names produced by IMMO_PROPERTY_JS; both the
+    HTTP and Selenium paths feed this one function so the row layout is
+    defined in a single place.
+    """
+    raw_id = property_url.split("/")[-1]
+    # Numeric from the start, so data_df and existing_df (Int64) agree on
+    # dtype and the ID survives file round trips untouched
+    listing_id = int(raw_id) if raw_id.isdigit() else None
+    main_info = fields.get("mainInfo") or {}
+
+    lat, lng = (None, None)
+    if fields.get("mapSrc"):
+        lat, lng = parse_coordinates_from_url(fields["mapSrc"])
+
+    return {
+        "Title": fields["title"],
+        "Rent/Price": fields["rent"],
+        "Rooms": fields["rooms"],
+        "Living Space": fields["livingSpace"],
+        "Location": fields["location"],
+        "Surroundings": format_surroundings(fields.get("surroundings")),
+        "Available From": main_info.get("Availability", "not found"),
+        "Type": main_info.get("Type", "not found"),
+        "No_of_rooms": main_info.get("No. of rooms", "not found"),
+        "Number of bathrooms": main_info.get("Number of bathrooms", "not found"),
+        "Surface Living": main_info.get("Living space", "not found"),
+        "Last Refurbishment": main_info.get("Last refurbishment", "not found"),
+        "Year Built": main_info.get("Year of construction", "not found"),
+        "Features": fields["features"],
+        "Description": fields["description"],
+        "Name": fields["name"],
+        "Full address": fields["address"],
+        "Phone": fields["phone"],
+        "Listing ID": listing_id,
+        "Object Reference": fields["objectRef"],
+        "Latitude": lat if lat else "not found",
+        "Longitude": lng if lng else "not found",
+        "Type (Rent/Buy)": property_type,
+        "URL": property_url,
+        "Website": base_url,
+        "Images": raw_id,  # image folder name, always the raw string
+        "IsActive": True,
+        "Last Seen Date": datetime.now()
+    }
+
+def parse_listing(tree, property_url, property_type, base_url):
+    """Extract fields from a selectolax tree (HTTP fast path) and build the row."""
+    phone_node = tree.css_first("a[href^='tel:']")
+    phone_number = (phone_node.attributes.get("href") or "").replace("tel:", "") if phone_node else "not found"
+
+    object_ref = "not found"
+    for dt in tree.css("dt"):
+        if "Object ref." in dt.text():
+            sibling = dt.next
+            while sibling is not None and sibling.tag != "dd":
+                sibling = sibling.next
+            if sibling is not None:
+                object_ref = sibling.text(strip=True)
+            break
+
+    map_node = tree.css_first("iframe[src*='google.com/maps']")
+
+    # Features
+    features = "not found"
+    features_node = tree.css_first(".FeaturesFurnishings_list_871ae")
+    if features_node is not None:
+        features = ", ".join(_node_lines(features_node))
+
+    # Main info
+    main_info = {}
+    dl_node = tree.css_first("div.CoreAttributes_coreAttributes_fe6ae dl")
+    if dl_node is not None:
+        for dt, dd in zip(dl_node.css("dt"), dl_node.css("dd")):
+            main_info[dt.text(strip=True).replace(":", "")] = dd.text(strip=True)
+
+    fields = {key: css_text(tree, sel) for key, sel in FIELD_SELECTORS.items()}
+    fields.update({
+        "phone": phone_number,
+        "objectRef": object_ref,
+        "mainInfo": main_info,
+        "surroundings": [_node_lines(item) for item in tree.css("ul.TravelTime_travelTimeList_6208d li")],
+        "features": features,
+        "mapSrc": map_node.attributes.get("src") if map_node else None,
+    })
+    return build_property_row(fields, property_url, property_type, base_url)
+
+def collect_image_urls_from_tree(tree):
+    """Image-URL extraction for the HTTP fast path (same selectors as the JS)."""
+    img_urls = []
+    for selector in IMAGE_SELECTORS:
+        nodes = tree.css(selector)
+        if nodes:
+            for img in nodes:
+                attrs = img.attributes
+                img_url = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src")
+                if img_url and not img_url.startswith("data:image"):
+                    img_urls.append(img_url)
+            break
+    return list(dict.fromkeys(img_urls))
+
+def scrape_property_http(property_url, property_type, base_url, base_image_folder, downloaded_hashes):
+    """Scrape one property entirely over HTTP. Returns None if the page
+    needs the Selenium fallback."""
+    tree = fetch_property_tree(property_url)
+    if tree is None:
+        return None
+
+    listing_id = property_url.split("/")[-1]
+    property_data = parse_listing(tree, property_url, property_type, base_url)
+    download_property_images(listing_id, base_image_folder, collect_image_urls_from_tree(tree), downloaded_hashes)
+    return property_data
+
 # Added: Retry, Exceptions
 # ---------- OPTIMIZED IMAGE DOWNLOAD ----------
-def download_single_image(img_url, folder_path, img_num, downloaded_hashes):
-    """Download a single image with retries and thread-safe hash deduplication."""
+async def _download_one(http, sem, img_url, filename, downloaded_hashes):
+    """Download a single image asynchronously with hash deduplication."""
+    if not img_url or img_url.startswith("data:image"):
+        return (False, "invalid_url_or_data_uri", img_url)
+    with _SEEN_URL_LOCK:
+        if img_url in _SEEN_URLS:
+            return (False, "duplicate_url", img_url)
     try:
-        if not img_url or img_url.startswith("data:image"):
-            return (False, "invalid_url_or_data_uri", img_url)
-
-        last_error = None
-        for _ in range(3):
-            try:
-                response = session.get(img_url, timeout=10)
-                if response.status_code == 200 and response.content:
-                    # img_hash = hashlib.md5(response.content).hexdigest()
-                    # with download_hashes_lock:
-                    #     if img_hash in downloaded_hashes:
-                    #         return (False, "duplicate_hash", img_url)
-                    #     downloaded_hashes.add(img_hash)
-
-                    filename = os.path.join(folder_path, f"image_{img_num}.jpg")
-                    with open(filename, "wb") as f:
-                        f.write(response.content)
-                    return (True, filename, img_url)
-                else:
-                    last_error = f"http_status_{response.status_code}"
-            except Exception as e:
-                last_error = e
-                time.sleep(0.2)
-        if last_error:
-            logger.debug(f"Failed to download image {img_num}: {last_error}")
-            return (False, f"failed_after_retries:{last_error}", img_url)
+        async with sem:
+            async with http.get(img_url) as response:
+                if response.status != 200:
+                    return (False, f"http_status_{response.status}", img_url)
+
+                # Stream the body to disk in 64 KB chunks, hashing as we
+                # go. Writes stay synchronous: chunks are small and local
+                # disk latency is negligible next to the network waits the
+                # event loop is overlapping.
+                hasher = xxhash.xxh3_64()
+                wrote = 0
+                with open(filename, "wb") as f:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        hasher.update(chunk)
+                        f.write(chunk)
+                        wrote += len(chunk)
+
+        if wrote == 0:
+            os.remove(filename)
+            return (False, "empty_body", img_url)
+
+        img_hash = hasher.intdigest()
+        with download_hashes_lock:
+            if img_hash in downloaded_hashes:
+                os.remove(filename)
+                return (False, "duplicate_hash", img_url)
+            downloaded_hashes.add(img_hash)
+        # Record the URL only now that the download succeeded - a timeout
+        # or error status must stay retryable on future runs
+        with _SEEN_URL_LOCK:
+            _SEEN_URLS.add(img_url)
+            _NEW_URLS.append(img_url)
+        return (True, filename, img_url)
     except Exception as e:
-        logger.debug(f"Failed to download image {img_num}: {e}")
+        logger.debug(f"Failed to download image {img_url}: {e}")
         return (False, f"exception:{e}", img_url)
-    return (False, "unknown_error", img_url)
+
+# One long-lived event loop in its own thread serves every listing's image
+# downloads - connections and TLS sessions are reused for the whole run,
+# and a single semaphore makes MAX_IMAGE_WORKERS the true global bound on
+# concurrent image fetches (per-listing loops multiplied their limits by
+# the number of listing workers).
+_IMAGE_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_IMAGE_LOOP.run_forever, name='img-loop', daemon=True).start()
+
+_image_http = None
+_image_sem = None
+
+async def _get_image_http():
+    """Lazily create the shared aiohttp session inside the image loop."""
+    global _image_http, _image_sem
+    if _image_http is None:
+        _image_http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=32),
+            timeout=aiohttp.ClientTimeout(total=10, connect=3),
+            headers=dict(session.headers),
+        )
+        _image_sem = asyncio.Semaphore(MAX_IMAGE_WORKERS)
+    return _image_http
+
+async def _close_image_http():
+    if _image_http is not None:
+        await _image_http.close()
+
+def _shutdown_image_loop():
+    try:
+        asyncio.run_coroutine_threadsafe(_close_image_http(), _IMAGE_LOOP).result(timeout=5)
+    except Exception:
+        pass
+    _IMAGE_LOOP.call_soon_threadsafe(_IMAGE_LOOP.stop)
+
+atexit.register(_shutdown_image_loop)
+
+async def _download_all(folder_path, img_urls, downloaded_hashes):
+    """Fan out one listing's image downloads over the shared session."""
+    # Build all target paths up front - one batch of path joins instead of
+    # interleaving them with task creation
+    paths = [os.path.join(folder_path, f"image_{i}.jpg") for i in range(1, len(img_urls) + 1)]
+    http = await _get_image_http()
+    tasks = [
+        _download_one(http, _image_sem, url, path, downloaded_hashes)
+        for url, path in zip(img_urls, paths)
+    ]
+    return await asyncio.gather(*tasks)
 
 # Changed: Logging to show Fail Downloads
 # ---------- SCRAPE IMAGES WITH PARALLEL DOWNLOADS ----------
-def scrape_property_images(driver, listing_id, base_image_folder, downloaded_hashes):
-    """Optimized image scraping - no page reload, parallel downloads"""
+def download_property_images(listing_id, base_image_folder, img_urls, downloaded_hashes):
+    """Parallel download of a listing's image URLs (collected by the batch JS)"""
     folder_path = os.path.join(base_image_folder, listing_id)
     os.makedirs(folder_path, exist_ok=True)
-    
+
     try:
-        # Try multiple selectors for image containers
-        img_elements = []
-        # Added: ul.splide__list img
-        selectors = [
-            "ul.splide__list img",
-            "//li[contains(@class, 'splide__slide')]//img",
-            ".carousel img", 
-            ".gallery img",
-            ".images img",
-            "img[src*='image']",
-            ".splide__list img"
-        ]
-        
-        for selector in selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    img_elements = elements
-                    break
-            except:
-                continue
-        
-        if not img_elements:
-            return "not found"
-        
-        # Extract all image URLs first
-        img_urls = []
-        for img in img_elements:
-            img_url = img.get_attribute("src") or img.get_attribute("data-src") or img.get_attribute("data-lazy-src")
-            if img_url and not img_url.startswith("data:image"):
-                img_urls.append(img_url)
-        # Deduplicate URLs
-        img_urls = list(dict.fromkeys(img_urls))
-        
         if not img_urls:
             return "not found"
-        
+
         print(f"📸 Downloading {len(img_urls)} images for {listing_id} in parallel...")
-        
+
         # Ensure per-listing set exists
         if downloaded_hashes is None:
             downloaded_hashes = set()
 
-        # Parallel download using ThreadPoolExecutor
+        # Submit this listing's fan-out to the long-lived image loop and
+        # block until its downloads finish
         downloaded_count = 0
         failures = 0
-        with ThreadPoolExecutor(max_workers=MAX_IMAGE_WORKERS) as executor:
-            futures = {
-                executor.submit(download_single_image, url, folder_path, i, downloaded_hashes): (i, url)
-                for i, url in enumerate(img_urls, start=1)
-            }
+        results = asyncio.run_coroutine_threadsafe(
+            _download_all(folder_path, img_urls, downloaded_hashes), _IMAGE_LOOP
+        ).result()
+        for success, detail, url in results:
+            if success:
+                downloaded_count += 1
+            else:
+                failures += 1
+                print(f"❌ Image download skipped/failed: {url} -> {detail}")
 
-            for future in as_completed(futures):
-                try:
-                    success, detail, url = future.result()
-                    if success:
-                        downloaded_count += 1
-                    else:
-                        failures += 1
-                        print(f"❌ Image download skipped/failed: {url} -> {detail}")
-                except Exception as e:
-                    failures += 1
-                    idx, url = futures[future]
-                    print(f"❌ Image download exception for {url}: {e}")
+        # Persist the URLs this listing added, one executemany per listing
+        with _SEEN_URL_LOCK:
+            new_urls, _NEW_URLS[:] = list(_NEW_URLS), []
+        db_record_urls(new_urls)
 
         print(f"✅ Downloaded {downloaded_count}/{len(img_urls)} images, failures: {failures}")
         return folder_path if downloaded_count > 0 else "not found"
@@ -220,6 +567,28 @@ def scrape_property_images(driver, listing_id, base_image_folder, downloaded_has
         return "not found"
 
 # ---------- SCRAPE DATA ----------
+def scrape_property_selenium(driver, property_url, property_type, base_url, base_image_folder, downloaded_hashes):
+    """Selenium fallback for pages the plain HTTP fetch couldn't serve."""
+    driver.get(property_url)
+    # Wait for the title instead of a fixed sleep - returns the moment the
+    # page is usable; on timeout extraction below degrades to 'not found'
+    try:
+        WebDriverWait(driver, REDUCED_WAIT_TIME).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='ListingTitle_spotlightTitle']"))
+        )
+    except TimeoutException:
+        pass
+
+    listing_id = property_url.split("/")[-1]
+
+    # Extract every field in one execute_script round trip
+    data = driver.execute_script(IMMO_PROPERTY_JS, FIELD_SELECTORS, IMAGE_SELECTORS)
+
+    # Download images (URLs were collected by the same JS call)
+    download_property_images(listing_id, base_image_folder, data.get("imgUrls") or [], downloaded_hashes)
+
+    return build_property_row(data, property_url, property_type, base_url)
+
 def scrape_immoscout24(driver, wait, base_url, base_image_folder, existing_df=None):
     all_properties = []
     page_no = 1
@@ -229,35 +598,47 @@ def scrape_immoscout24(driver, wait, base_url, base_image_folder, existing_df=No
     RETRY_DELAY = 3
     attempt = 0
     seen_ids = set()
-    
+
+    # Already-scraped IDs come from the seen database; the data file is
+    # only consulted to seed the set on the first run after an upgrade, so
+    # existing installs don't rescrape everything once. IDs stay numeric
+    # (nullable Int64) - int comparisons and hashing beat strings, and the
+    # column survives CSV round trips that float-ify plain int64
+    existing_ids = db_load_listing_ids()
+    if existing_df is not None and not existing_df.empty:
+        existing_df["Listing ID"] = pd.to_numeric(existing_df["Listing ID"], errors="coerce").astype("Int64")
+        existing_ids |= set(existing_df["Listing ID"].dropna())
+
 
     # Changed: While Condition
     while page_no<=50:
-        page_url = re.sub(r"pn=\d+", f"pn={page_no}", base_url)
+        page_url = _PN_RE.sub(f"pn={page_no}", base_url)
         driver.get(page_url)
-        time.sleep(PAGE_LOAD_WAIT)
+        # Wait for the result list rather than sleeping a fixed interval;
+        # on timeout the error-page check below decides what happened
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-test="result-list-container"]')))
+        except TimeoutException:
+            pass
 
         # Changed: Accept cookies (If not already accepted)
         try:
             accept_btn = driver.find_element(By.ID, "onetrust-accept-btn-handler")
             accept_btn.click()
             time.sleep(0.5)
+            sync_driver_cookies(driver)
         except:
             pass
 
-        # Quick error page check
+        # Quick error page check - one regex test in the browser instead of
+        # shipping the whole body text over the wire. Case-insensitive, so
+        # the translated error banners match too (the old lowered-text
+        # comparison silently missed the capitalized phrases).
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-            if any(phrase in page_text for phrase in [
-                "requested page cannot be displayed",
-                "page cannot be displayed",
-                "no properties found",
-                "keine objekte gefunden",
-                "Oh no, something went wrong!",
-                "Oups, il y a eu une erreur!",
-                "Oh nein, da ist etwas schiefgelaufen!",
-                "Ops, c'è stato un errore!"
-            ]):
+            is_error_page = driver.execute_script("""
+                return /requested page cannot be displayed|page cannot be displayed|no properties found|keine objekte gefunden|oh no, something went wrong!|oups, il y a eu une erreur!|oh nein, da ist etwas schiefgelaufen!|ops, c'è stato un errore!/i.test(document.body.innerText);
+            """)
+            if is_error_page:
                 logger.info(f"✅ No properties found at page {page_no, page_url}")
                 break
         except:
@@ -286,15 +667,15 @@ def scrape_immoscout24(driver, wait, base_url, base_image_folder, existing_df=No
             break
         
         # Filter out already scraped listings
-        if existing_df is not None and not existing_df.empty:
-            existing_df['Listing ID']=existing_df["Listing ID"].astype("str")
+        if existing_ids:
             filtered_links = []
             for link in card_links:
-                listing_id_candidate = link.rstrip('/').split('/')[-1]
-                if str(listing_id_candidate) not in existing_df["Listing ID"].values:
+                candidate = link.rstrip('/').split('/')[-1]
+                listing_id_candidate = int(candidate) if candidate.isdigit() else None
+                if listing_id_candidate not in existing_ids:
                     filtered_links.append(link)
                 else:
-                    seen_ids.add(str(listing_id_candidate))
+                    seen_ids.add(listing_id_candidate)
         else:
             filtered_links = card_links
 
@@ -305,110 +686,54 @@ def scrape_immoscout24(driver, wait, base_url, base_image_folder, existing_df=No
 
         total_links = len(filtered_links)
 
-        for idx, property_url in enumerate(filtered_links, start=1):
-            try:
-                driver.get(property_url)
-                time.sleep(PROPERTY_LOAD_WAIT)
-
-                listing_id = property_url.split("/")[-1]
-                
-                # Extract all data
-                title = safe_find(driver, By.CLASS_NAME, "ListingTitle_spotlightTitle_75f24")
-                rent = safe_find(driver, By.CLASS_NAME, 'SpotlightAttributesPrice_value_2af8f')
-                rooms = safe_find(driver, By.CLASS_NAME, "SpotlightAttributesNumberOfRooms_value_a5947")
-                living_space = safe_find(driver, By.CLASS_NAME, "SpotlightAttributesUsableSpace_value_48823")
-                location = safe_find(driver, By.CLASS_NAME, 'AddressDetails_address_284e6')
-                name = safe_find(driver, By.CLASS_NAME, 'ListerContactPhone_person_0c523')
-                address = safe_find(driver, By.XPATH, "//div[contains(@class, 'ListingDetails_column')]/address")
-                phone_number = safe_find(driver, By.CSS_SELECTOR, "a[href^='tel:']", attr="href").replace("tel:", "")
-                description = safe_find(driver, By.CSS_SELECTOR, "div.Description_descriptionBody_3745e")
-                object_ref = safe_find(driver, By.XPATH, "//dt[contains(text(), 'Object ref.')]/following-sibling::dd[1]")
-                lat, lng = extract_coordinates_from_iframe(driver, wait)
-
-                # Surroundings
-                surroundings_str = "not found"
-                try:
-                    surrounding_list_element = driver.find_element(By.CSS_SELECTOR, "ul.TravelTime_travelTimeList_6208d")
-                    items = surrounding_list_element.find_elements(By.TAG_NAME, "li")
-                    surroundings_dict = {}
-                    for item in items:
-                        parts = item.text.strip().split("\n")
-                        if len(parts) == 3:
-                            category, time_str, place = parts
-                            surroundings_dict[category] = f"{time_str} - {place}"
-                    surroundings_str = "; ".join([f"{cat}: {info}" for cat, info in surroundings_dict.items()])
-                except:
-                    pass
-
-                # Features
-                try:
-                    features_element = driver.find_element(By.CLASS_NAME, "FeaturesFurnishings_list_871ae")
-                    features = features_element.text.replace("\n", ", ")
-                except:
-                    features = "not found"
-
-                # Main info
-                main_info = {}
+        # HTTP fetches are independent, so run the whole page's listings in
+        # parallel; anything the fast path can't serve drops into the
+        # fallback list and goes through the single browser serially
+        fallback_links = []
+        done = 0
+        with ThreadPoolExecutor(max_workers=MAX_LISTING_WORKERS) as executor:
+            future_to_url = {
+                executor.submit(scrape_property_http, url, property_type, base_url, base_image_folder, downloaded_hashes): url
+                for url in filtered_links
+            }
+            for future in as_completed(future_to_url):
+                property_url = future_to_url[future]
                 try:
-                    main_info_div = driver.find_element(By.CSS_SELECTOR, "div.CoreAttributes_coreAttributes_fe6ae dl")
-                    dt_elements = main_info_div.find_elements(By.TAG_NAME, "dt")
-                    dd_elements = main_info_div.find_elements(By.TAG_NAME, "dd")
-                    for dt, dd in zip(dt_elements, dd_elements):
-                        main_info[dt.text.strip().replace(":", "")] = dd.text.strip()
-                except:
-                    pass
-
-                # Scrape images (optimized - no page reload, parallel downloads)
-                scrape_property_images(driver, listing_id, base_image_folder, downloaded_hashes)
-
-                property_data = {
-                    "Title": title,
-                    "Rent/Price": rent,
-                    "Rooms": rooms,
-                    "Living Space": living_space,
-                    "Location": location,
-                    "Surroundings": surroundings_str,
-                    "Available From": main_info.get("Availability", "not found"),
-                    "Type": main_info.get("Type", "not found"),
-                    "No_of_rooms": main_info.get("No. of rooms", "not found"),
-                    "Number of bathrooms": main_info.get("Number of bathrooms", "not found"),
-                    "Surface Living": main_info.get("Living space", "not found"),
-                    "Last Refurbishment": main_info.get("Last refurbishment", "not found"),
-                    "Year Built": main_info.get("Year of construction", "not found"),
-                    "Features": features,
-                    "Description": description,
-                    "Name": name,
-                    "Full address": address,
-                    "Phone": phone_number,
-                    "Listing ID": listing_id,
-                    "Object Reference": object_ref,
-                    "Latitude": lat if lat else "not found",
-                    "Longitude": lng if lng else "not found",
-                    "Type (Rent/Buy)": property_type,
-                    "URL": property_url,
-                    "Website": base_url,
-                    "Images": listing_id,
-                    "IsActive": True,
-                    "Last Seen Date": datetime.now()
-                }
-
+                    property_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error scraping property {property_url}: {e}")
+                    continue
+                if property_data is None:
+                    fallback_links.append(property_url)
+                    continue
                 all_properties.append(property_data)
-                print(f"✅ [{idx}/{total_links}] {title[:40]}...")
+                done += 1
+                print(f"✅ [{done}/{total_links}] {property_data['Title'][:40]}...")
 
+        for property_url in fallback_links:
+            try:
+                property_data = scrape_property_selenium(driver, property_url, property_type, base_url, base_image_folder, downloaded_hashes)
+                all_properties.append(property_data)
+                done += 1
+                print(f"✅ [{done}/{total_links}] {property_data['Title'][:40]}...")
             except Exception as e:
-                logger.error(f"Error scraping property {idx}: {e}")
+                logger.error(f"Error scraping property {property_url}: {e}")
         page_no += 1
 
+    # The run's active IDs (freshly scraped plus re-seen) go back to the
+    # caller, which records them in the seen database only after save_data
+    # has landed their rows - recording first would skip them forever if
+    # the save failed
+    scraped_ids = {int(p["Listing ID"]) for p in all_properties if p["Listing ID"] is not None}
+    active_ids = scraped_ids | {int(i) for i in seen_ids}
+
     # update existing_df once using the accumulated seen ids
     if existing_df is not None and not existing_df.empty:
         now = datetime.now()
-        # ensure comparison is string-based
-        existing_df["Listing ID"] = existing_df["Listing ID"].astype(str)
-
-        seen_list = list(seen_ids)
+        # 'Listing ID' was converted to Int64 once, up front
 
         # Mark seen listings as active and update 'Last Seen Date'
-        mask_seen = existing_df["Listing ID"].isin(seen_list)
+        mask_seen = existing_df["Listing ID"].isin(seen_ids)
         existing_df.loc[mask_seen, "Last Seen Date"] = now
         existing_df.loc[mask_seen, "IsActive"] = True
 
@@ -418,52 +743,127 @@ def scrape_immoscout24(driver, wait, base_url, base_image_folder, existing_df=No
         # No pages succeeded: do not change IsActive flags (safer)
         logger.info("No page was successfully processed — existing_df left unchanged for IsActive flags.")
 
-    return all_properties
+    return all_properties, active_ids
 
 # ---------- SAVE DATA ----------
+def load_existing_data(save_dir, property_type):
+    """Load previously scraped data, migrating from the legacy CSV if needed.
+
+    Returns None when there's nothing to load. A legacy CSV is read once
+    and rewritten as Parquet by the next save_data call.
+    """
+    parquet_path = os.path.join(save_dir, f"immoscout24_{property_type}.parquet")
+    csv_path = os.path.join(save_dir, f"immoscout24_{property_type}.csv")
+
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine='pyarrow')
+    if os.path.exists(csv_path):
+        logging.info(f"Migrating legacy CSV data for {property_type} to Parquet")
+        return pd.read_csv(csv_path)
+    return None
+
 def save_data(data, save_dir, property_type, existing_df=None):
     os.makedirs(save_dir, exist_ok=True)
-    file_name = os.path.join(save_dir, f"immoscout24_{property_type}.csv")
+    # Parquet: typed columns (keeps Listing ID as Int64 across runs),
+    # zstd-compressed, and much faster to load/save than CSV
+    file_name = os.path.join(save_dir, f"immoscout24_{property_type}.parquet")
 
     data_df = pd.DataFrame(data)
+    if data_df.empty:
+        # Nothing new - the steady state of an incremental run. Still
+        # rewrite existing_df so its refreshed IsActive/Last Seen flags
+        # aren't lost (an empty frame has no columns to merge on).
+        if existing_df is not None and not existing_df.empty:
+            existing_df.to_parquet(file_name, index=False, engine='pyarrow', compression='zstd')
+            logging.info(f"No new listings; refreshed flags saved to {file_name}")
+        else:
+            logging.info("No new listings and no existing data; nothing to save")
+        return
+
+    # Normalize the merge key on both frames - combine_first aligns on
+    # index values, so a str/int mismatch would silently match nothing
+    data_df["Listing ID"] = pd.to_numeric(data_df["Listing ID"], errors="coerce").astype("Int64")
     data_df = data_df.drop_duplicates(subset=["Listing ID"])
-    
-    if os.path.exists(file_name) and existing_df is not None and not existing_df.empty:
-        # Save the updated existing_df + new data
-        combined_df = pd.concat([existing_df, data_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=["Listing ID"], keep='last')
-        combined_df.to_csv(file_name, index=False)
-        logging.info("Updated existing data")
 
-    elif os.path.exists(file_name):
-        # File exists but no existing_df provided - just append new data
-        data_df.to_csv(file_name, index=False, mode='a', header=False)
-        logging.info("Appending new data to existing file")
+    if existing_df is None and os.path.exists(file_name):
+        # File exists but no existing_df provided (e.g. load failed earlier);
+        # unlike CSV there is no append mode, so merge before rewriting
+        try:
+            existing_df = pd.read_parquet(file_name, engine='pyarrow')
+        except Exception as e:
+            logging.error(f"Could not re-read {file_name} before save: {e}")
 
+    if existing_df is not None and not existing_df.empty:
+        # Index-aligned merge: new rows win per cell, old rows are kept as
+        # they are. Cheaper than concat + full-frame drop_duplicates, and
+        # it preserves old column values a partial re-scrape came back
+        # without (e.g. a field the page stopped rendering)
+        existing_df["Listing ID"] = pd.to_numeric(existing_df["Listing ID"], errors="coerce").astype("Int64")
+        combined_df = (
+            data_df.set_index("Listing ID")
+            .combine_first(existing_df.set_index("Listing ID"))
+            .reset_index()
+        )
+        combined_df.to_parquet(file_name, index=False, engine='pyarrow', compression='zstd')
+        logging.info("Updated existing data")
     else:
-        # File doesn't exist - create new file
-        data_df.to_csv(file_name, index=False)
+        data_df.to_parquet(file_name, index=False, engine='pyarrow', compression='zstd')
         logging.info("Created new data file")
-    
+
     logging.info(f"\n💾 {property_type} data saved to {file_name}\n\n")
 
 # ---------- MAIN ----------
+def run_one(url, save_dir, base_image_folder):
+    """Scrape one listing URL end to end with its own browser.
+
+    Rent and Buy write to separate files and folders, so each URL can run
+    in its own thread with a dedicated driver.
+    """
+    logging.info(f"\n🔗 Processing URL: {url}")
+    url_start_time = time.time()
+
+    property_type = "Rent" if "/rent/" in url else "Buy"
+
+    try:
+        existing_df = load_existing_data(save_dir, property_type)
+        if existing_df is not None:
+            logging.info(f"Loaded {len(existing_df)} previously scraped IDs for {property_type}")
+        else:
+            logging.info(f"No existing data file for {property_type}. Performing full scrape.")
+    except Exception as e:
+        existing_df = None
+        logging.info(f"No existing Data for {property_type}. Performing Full scrape.")
+
+    driver, wait = init_driver()
+    try:
+        data, active_ids = scrape_immoscout24(driver, wait, url, base_image_folder, existing_df)
+        logging.info("Script Completed")
+        save_data(data, save_dir, property_type, existing_df)
+        # Only after the rows are safely on disk does the run get recorded
+        # in the seen database; if save_data raised, the listings stay
+        # unseen and are retried next run
+        db_record_run(property_type, active_ids)
+    finally:
+        driver.quit()
+
+    url_time = time.time() - url_start_time
+    print(f"✅ {property_type} completed: {len(data)} properties in {url_time:.2f}s ({url_time/60:.2f}min)")
+    return len(data)
+
 def main():
     start_time = time.time()
     print("🚀 Starting ImmoScout24 Scraper (OPTIMIZED VERSION)")
     print("="*60)
     print(f"⚡ Parallel image downloads: {MAX_IMAGE_WORKERS} workers")
     print(f"⚡ Wait times: {REDUCED_WAIT_TIME}s")
-    print(f"⚡ Page load wait: {PAGE_LOAD_WAIT}s")
+    print(f"⚡ Page loads: event-driven waits (up to {REDUCED_WAIT_TIME}s)")
     print("="*60)
-    
-    driver, wait = init_driver()
-    
+
     save_dir = "./scraped_data/immoscout24/data"
     base_image_folder = "./scraped_data/immoscout24/images"
     os.makedirs(save_dir, exist_ok=True)
     os.makedirs(base_image_folder, exist_ok=True)
-    
+
     print(f"📁 Excel files: {save_dir}")
     print(f"🖼️  Images: {base_image_folder}")
     print("="*60)
@@ -474,50 +874,29 @@ def main():
     ]
 
     total_properties = 0
-    
-    try:
-        for url in urls:
-            logging.info(f"\n🔗 Processing URL: {url}")
-            url_start_time = time.time()
 
-            property_type = "Rent" if "/rent/" in url else "Buy"
+    try:
+        # Rent and Buy are independent, so run them side by side, each with
+        # its own driver
+        with ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix='url') as executor:
+            futures = [executor.submit(run_one, url, save_dir, base_image_folder) for url in urls]
+            for future in as_completed(futures):
+                total_properties += future.result()
 
-            try:
-                csv_path = os.path.join(save_dir, f"immoscout24_{property_type}.csv")
-                if os.path.exists(csv_path):
-                    existing_df = pd.read_csv(csv_path)
-                    logging.info(f"Loaded {len(existing_df)} previously scraped IDs for {property_type}")
-                else:
-                    existing_df = None
-                    logging.info(f"No existing data file for {property_type}. Performing full scrape.")
-            except Exception as e:
-                existing_df = None
-                logging.info(f"No existing Data for {property_type}. Performing Full scrape.")
-
-            data = scrape_immoscout24(driver, wait, url, base_image_folder, existing_df)
-            logging.info("Script Completed")
-            save_data(data, save_dir, property_type, existing_df)
-            
-            total_properties += len(data)
-            url_time = time.time() - url_start_time
-            print(f"✅ {property_type} completed: {len(data)} properties in {url_time:.2f}s ({url_time/60:.2f}min)")
-        
         end_time = time.time()
         total_time = end_time - start_time
-        
+
         print(f"\n🎉 ImmoScout24 scraping completed!")
         print(f"📊 Total properties: {total_properties}")
         print(f"⏱️  Total time: {total_time:.2f}s ({total_time/60:.2f}min, {total_time/3600:.2f}hrs)")
         print(f"📈 Avg per property: {total_time/total_properties:.2f}s" if total_properties > 0 else "")
-        
+
     except KeyboardInterrupt:
         print("\n⚠️ Interrupted by user")
     except Exception as e:
         print(f"\n❌ Failed with error: {e}")
         logger.exception(e)
     finally:
-        print("🔚 Closing browser...")
-        driver.quit()
         session.close()
         print("✅ Cleanup complete")
 